@@ -4,11 +4,31 @@ Generate BCCN static site structure based on the new Information Architecture
 """
 
 import os
+import re
+import sys
 import json
+import argparse
 from pathlib import Path
 
 BASE_URL = "/BCCN_website"
 
+# Frequently linked URLs, built once from BASE_URL
+HOME_URL = f'{BASE_URL}/'
+URLS = {slug: f'{BASE_URL}/{slug}/' for slug in (
+    'about',
+    'about/contact-and-help',
+    'programs-and-opportunities',
+    'people-and-partners',
+    'resources-and-tools',
+    'news-events-community',
+    'faculty-and-staff',
+    'students',
+    'bccn-resources',
+    'off-campus-partners',
+    'funders-and-investors',
+    'media',
+)}
+
 # Page tagging system for category filters
 PAGE_TAGS = {
     # Home page
@@ -50,6 +70,30 @@ PAGE_TAGS = {
     '/resources-and-tools/give-and-sponsor/': ['off-campus-partners', 'funders-and-investors', 'media'],
 }
 
+# Display titles used on filter landing pages, keyed by PAGE_TAGS URL
+_URL_TITLE_OVERRIDES = {
+    '/': 'Home',
+    '/about/': 'About BCCN',
+    '/students/': 'Students',
+    '/students/climate-classes/': 'Climate Classes',
+    '/students/internships-and-jobs/': 'Internships and Jobs',
+    '/students/clubs-and-organizations/': 'Clubs and Organizations',
+    '/students/hot-topics/': 'Hot Topics Global – Students',
+    '/faculty-and-staff/': 'Faculty and Staff',
+    '/faculty-and-staff/people-projects-and-programs/': 'People, Projects and Programs',
+    '/faculty-and-staff/financial-support/': 'Financial Support',
+    '/faculty-and-staff/hot-topics/': 'Global Hot Topics – Faculty & Staff',
+    '/faculty-and-staff/find-help/': 'Find HELP!',
+    '/bccn-resources/': 'Cool BCCN Resources',
+    '/bccn-resources/bccn-campus-climate-news/': 'BCCN Campus Climate News',
+    '/bccn-resources/podcasts-and-videos/': 'Podcasts and Videos',
+    '/bccn-resources/hot-topics/': 'BCCN Global Hot Topics – central',
+    '/off-campus-partners/': 'Off Campus Partners',
+    '/media/media-inquiries/': 'Media Inquiries',
+    '/funders-and-investors/': 'Funders/Investors',
+    '/resources-and-tools/give-and-sponsor/': 'Sponsors',
+}
+
 # Filter category metadata
 FILTER_CATEGORIES = {
     'students': {
@@ -74,40 +118,49 @@ FILTER_CATEGORIES = {
     },
 }
 
-# Page template
-def create_page_template(title, breadcrumb, content, show_audience_filter=False, is_placeholder=False):
-    """Create an HTML page from template"""
+_FILTER_SLUGS = tuple(FILTER_CATEGORIES)
 
-    placeholder_badge = '<span class="placeholder-badge">PLACEHOLDER</span>' if is_placeholder else ''
-    audience_script = ""
+# Invert PAGE_TAGS once so each filter page walks only its own pages
+_PAGES_BY_CATEGORY = {category_slug: [] for category_slug in _FILTER_SLUGS}
+for page_url, tags in PAGE_TAGS.items():
+    for tag in tags:
+        # Tags without a filter category are ignored, as the per-category scan did
+        if tag in _PAGES_BY_CATEGORY:
+            _PAGES_BY_CATEGORY[tag].append(page_url)
 
-    if not show_audience_filter:
-        audience_script = """
-    <script>
-      // Hide audience filter on pages that don't need it
-      window.addEventListener('DOMContentLoaded', function() {
-        var filter = document.getElementById('audience-filter');
-        if (filter) filter.style.display = 'none';
-      });
-    </script>"""
+_PLACEHOLDER_BADGE = '<span class="placeholder-badge">PLACEHOLDER</span>'
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{title} - Berkeley Climate Change Network</title>
-  <link rel="icon" href="https://bccn.berkeley.edu/sites/default/files/favicon.ico" type="image/x-icon">
-</head>
-<body>
-  <div id="global-nav"></div>
+_CARD_TEMPLATE = """
+        <div class="card">
+          <h3><a href="{url}">{title}</a>{badge}</h3>
+          <p>Learn more about {title_lower}.</p>
+        </div>"""
 
-  <main>
-    {breadcrumb}
-    <h1>{title}{placeholder_badge}</h1>
-    {content}
-  </main>
+_FILTER_PREAMBLE_TEMPLATE = """
+    <div style="background: #f9f9f9; padding: 20px; border-left: 4px solid #FDB515; margin-bottom: 30px;">
+      <p style="font-style: italic; color: #666; margin: 0;">
+        <strong>Note:</strong> This filter landing page is a draft. UX enhancements to follow.
+      </p>
+    </div>
+
+    <p>Below are all pages relevant to <strong>{title}</strong>:</p>
+
+    <div class="card-grid">
+    """
+
+_FILTER_CARD_TEMPLATE = """
+        <div class="card">
+          <h3><a href="{url}">{title}</a></h3>
+          <p>View this page</p>
+        </div>
+        """
 
+_FILTER_POSTAMBLE = """
+    </div>
+    """
+
+# Shared page partials, formatted with BASE_URL once at import time
+_FOOTER_HTML = f"""
   <footer>
     <div class="container">
       <div class="card-grid">
@@ -130,7 +183,9 @@ def create_page_template(title, breadcrumb, content, show_audience_filter=False,
       </div>
       <p style="margin-top: 30px; text-align: center; color: #FDB515;">&copy; 2024 Berkeley Climate Change Network. All rights reserved.</p>
     </div>
-  </footer>
+  </footer>"""
+
+_NAV_SCRIPT = f"""
 
   <script>
     fetch('{BASE_URL}/nav.html?v=20251214')
@@ -138,155 +193,242 @@ def create_page_template(title, breadcrumb, content, show_audience_filter=False,
       .then(html => {{
         document.getElementById('global-nav').innerHTML = html;
       }});
-  </script>
-  {audience_script}
+  </script>"""
+
+_HIDE_FILTER_SCRIPT = """
+    <script>
+      // Hide audience filter on pages that don't need it
+      window.addEventListener('DOMContentLoaded', function() {
+        var filter = document.getElementById('audience-filter');
+        if (filter) filter.style.display = 'none';
+      });
+    </script>"""
+
+# Page template, pre-split around the per-page fields so rendering is
+# plain concatenation of already-built segments
+_PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>"""
+
+_PAGE_MID = """ - Berkeley Climate Change Network</title>
+  <link rel="icon" href="https://bccn.berkeley.edu/sites/default/files/favicon.ico" type="image/x-icon">
+</head>
+<body>
+  <div id="global-nav"></div>
+
+  <main>
+    """
+
+_PAGE_BODY_END = """
+  </main>
+""" + _FOOTER_HTML + _NAV_SCRIPT + """
+  """
+
+_PAGE_TAIL = """
 </body>
 </html>"""
 
+# The audience filter flag only selects between two fixed endings, so build both up front
+_PAGE_END_WITH_FILTER = _PAGE_BODY_END + _PAGE_TAIL
+_PAGE_END_NO_FILTER = _PAGE_BODY_END + _HIDE_FILTER_SCRIPT + _PAGE_TAIL
+
+def create_page_template(title, breadcrumb, content_parts, show_audience_filter=False, is_placeholder=False):
+    """Create an HTML page from template, joining the content parts once"""
+    return ''.join((
+        _PAGE_HEAD, title, _PAGE_MID,
+        breadcrumb,
+        '\n    <h1>', title, _PLACEHOLDER_BADGE if is_placeholder else '', '</h1>\n    ',
+        *content_parts,
+        _PAGE_END_WITH_FILTER if show_audience_filter else _PAGE_END_NO_FILTER,
+    ))
+
 def create_breadcrumb(crumbs):
     """Create breadcrumb navigation"""
     if not crumbs:
         return ""
 
-    parts = ['<nav class="breadcrumb">']
-    for i, (name, url) in enumerate(crumbs):
-        if i > 0:
-            parts.append(' &gt; ')
-        if url:
-            parts.append(f'<a href="{url}">{name}</a>')
-        else:
-            parts.append(name)
-    parts.append('</nav>')
-    return ''.join(parts)
+    items = (f'<a href="{url}">{name}</a>' if url else name for name, url in crumbs)
+    return '<nav class="breadcrumb">' + ' &gt; '.join(items) + '</nav>'
 
-def lorem_ipsum():
-    """Return lorem ipsum placeholder text"""
-    return """
+_LOREM = """
     <p>Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.
     Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat.</p>
 
     <p>Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur.
     Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum.</p>"""
 
+def lorem_ipsum():
+    """Return lorem ipsum placeholder text"""
+    return _LOREM
+
 def create_card_links(links):
     """Create a grid of card links"""
-    cards = ['<div class="card-grid">']
-    for title, url, is_placeholder in links:
-        badge = '<span class="placeholder-badge">PLACEHOLDER</span>' if is_placeholder else ''
-        cards.append(f"""
-        <div class="card">
-          <h3><a href="{url}">{title}</a>{badge}</h3>
-          <p>Learn more about {title.lower()}.</p>
-        </div>""")
-    cards.append('</div>')
-    return ''.join(cards)
-
-def ensure_dir(path):
-    """Ensure directory exists"""
-    Path(path).mkdir(parents=True, exist_ok=True)
+    return '<div class="card-grid">' + ''.join(
+        _CARD_TEMPLATE.format(
+            url=url,
+            title=title,
+            badge=_PLACEHOLDER_BADGE if is_placeholder else '',
+            title_lower=title.lower(),
+        )
+        for title, url, is_placeholder in links
+    ) + '</div>'
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_BETWEEN_TAGS_RE = re.compile(r'>\s+<')
+# Inline scripts are kept verbatim: collapsing their newlines would let a
+# // comment swallow the rest of the code
+_SCRIPT_RE = re.compile(r'(<script\b.*?</script>)', re.DOTALL | re.IGNORECASE)
+
+def minify_html(html):
+    """Collapse whitespace runs and drop whitespace between tags, leaving scripts untouched"""
+    # Even indexes are markup, odd indexes are the <script> elements between them
+    parts = _SCRIPT_RE.split(html)
+    last = len(parts) - 1
+    for i in range(0, len(parts), 2):
+        text = _BETWEEN_TAGS_RE.sub('><', _WHITESPACE_RE.sub(' ', parts[i]))
+        # Whitespace between markup and an adjacent script is between tags too
+        if i > 0 and (text == ' ' or text.startswith(' <')):
+            text = text[1:]
+        if i < last and text.endswith('> '):
+            text = text[:-1]
+        parts[i] = text
+    return ''.join(parts)
 
 def write_page(path, content):
     """Write page content to file"""
-    ensure_dir(os.path.dirname(path))
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"Created: {path}")
+    # Small whole-file writes don't need the buffered text I/O stack
+    data = memoryview(content.encode('utf-8'))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(path, flags, 0o644)
+    except FileNotFoundError:
+        # Regenerating over an existing site is the common case; only a
+        # fresh output tree needs its directories created first
+        Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, flags, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+class Page:
+    """A page to generate: output path, title, breadcrumb trail and content parts"""
+    __slots__ = ('path', 'title', 'breadcrumb', 'content_parts', 'show_audience_filter', 'is_placeholder')
+
+    def __init__(self, path, title, breadcrumb, content_parts, show_audience_filter=False, is_placeholder=False):
+        self.path = path
+        self.title = title
+        self.breadcrumb = breadcrumb
+        self.content_parts = content_parts
+        self.show_audience_filter = show_audience_filter
+        self.is_placeholder = is_placeholder
 
 # Define all pages to generate
 pages = []
 
 # HOME PAGE
-pages.append({
-    'path': 'index.html',
-    'title': 'Home',
-    'breadcrumb': [],
-    'show_audience_filter': False,
-    'content': f"""
+pages.append(Page(
+    path='index.html',
+    title='Home',
+    breadcrumb=(),
+    show_audience_filter=False,
+    content_parts=(
+        """
     <div style="background: linear-gradient(135deg, #003262 0%, #3B7EA1 100%); color: white; padding: 60px 40px; margin: -40px -20px 40px -20px; text-align: center; border-radius: 8px;">
       <h2 style="color: #FDB515; font-size: 42px; margin-bottom: 20px;">Welcome to the Berkeley Climate Change Network</h2>
       <p style="font-size: 20px; max-width: 800px; margin: 0 auto;">Connecting the UC Berkeley community in climate research, education, and action.</p>
     </div>
 
     <h2>Explore BCCN</h2>
-    {create_card_links([
-        ('About BCCN', f'{BASE_URL}/about/', False),
-        ('Programs & Opportunities', f'{BASE_URL}/programs-and-opportunities/', False),
-        ('People & Partners', f'{BASE_URL}/people-and-partners/', False),
-        ('Resources & Tools', f'{BASE_URL}/resources-and-tools/', False),
-        ('News, Events & Community', f'{BASE_URL}/news-events-community/', False),
-    ])}
-
-    <h2 style="margin-top: 50px;">Quick Access</h2>
-    {create_card_links([
-        ('For Faculty & Staff', f'{BASE_URL}/faculty-and-staff/', False),
-        ('For Students', f'{BASE_URL}/students/', False),
-        ('For Partners', f'{BASE_URL}/off-campus-partners/', False),
-        ('Get Help', f'{BASE_URL}/about/contact-and-help/', False),
-    ])}
-    """
-})
+    """,
+        create_card_links([
+            ('About BCCN', URLS['about'], False),
+            ('Programs & Opportunities', URLS['programs-and-opportunities'], False),
+            ('People & Partners', URLS['people-and-partners'], False),
+            ('Resources & Tools', URLS['resources-and-tools'], False),
+            ('News, Events & Community', URLS['news-events-community'], False),
+        ]),
+        '\n\n    <h2 style="margin-top: 50px;">Quick Access</h2>\n    ',
+        create_card_links([
+            ('For Faculty & Staff', URLS['faculty-and-staff'], False),
+            ('For Students', URLS['students'], False),
+            ('For Partners', URLS['off-campus-partners'], False),
+            ('Get Help', URLS['about/contact-and-help'], False),
+        ]),
+        '\n    ',
+    )
+))
 
 # ABOUT SECTION
-pages.append({
-    'path': 'about/index.html',
-    'title': 'About BCCN',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('About BCCN', None)],
-    'show_audience_filter': False,
-    'content': f"""
-    {lorem_ipsum()}
-
-    <h2>Learn More</h2>
-    {create_card_links([
-        ('Contact & Get Help', f'{BASE_URL}/about/contact-and-help/', False),
-        ('Our Network & Governance', f'{BASE_URL}/about/our-network-governance/', True),
-    ])}
-    """
-})
-
-pages.append({
-    'path': 'about/contact-and-help/index.html',
-    'title': 'Contact and Help',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('About', f'{BASE_URL}/about/'), ('Contact and Help', None)],
-    'show_audience_filter': False,
-    'content': f"""
-    <h2>Find HELP!</h2>
-    {lorem_ipsum()}
+pages.append(Page(
+    path='about/index.html',
+    title='About BCCN',
+    breadcrumb=(('Home', HOME_URL), ('About BCCN', None)),
+    show_audience_filter=False,
+    content_parts=(
+        '\n    ',
+        lorem_ipsum(),
+        '\n\n    <h2>Learn More</h2>\n    ',
+        create_card_links([
+            ('Contact & Get Help', URLS['about/contact-and-help'], False),
+            ('Our Network & Governance', URLS['about'] + 'our-network-governance/', True),
+        ]),
+        '\n    ',
+    )
+))
+
+pages.append(Page(
+    path='about/contact-and-help/index.html',
+    title='Contact and Help',
+    breadcrumb=(('Home', HOME_URL), ('About', URLS['about']), ('Contact and Help', None)),
+    show_audience_filter=False,
+    content_parts=(
+        '\n    <h2>Find HELP!</h2>\n    ',
+        lorem_ipsum(),
+        """
 
     <h2>Contact Information</h2>
     <p>For general inquiries about BCCN, please reach out to our team.</p>
-    {lorem_ipsum()}
-    """
-})
-
-pages.append({
-    'path': 'about/our-network-governance/index.html',
-    'title': 'Our Network Governance',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('About', f'{BASE_URL}/about/'), ('Network Governance', None)],
-    'show_audience_filter': False,
-    'is_placeholder': True,
-    'content': lorem_ipsum()
-})
+    """,
+        lorem_ipsum(),
+        '\n    ',
+    )
+))
+
+pages.append(Page(
+    path='about/our-network-governance/index.html',
+    title='Our Network Governance',
+    breadcrumb=(('Home', HOME_URL), ('About', URLS['about']), ('Network Governance', None)),
+    show_audience_filter=False,
+    is_placeholder=True,
+    content_parts=(lorem_ipsum(),)
+))
 
 # PROGRAMS & OPPORTUNITIES SECTION
-pages.append({
-    'path': 'programs-and-opportunities/index.html',
-    'title': 'Programs & Opportunities',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('Programs & Opportunities', None)],
-    'show_audience_filter': True,
-    'content': f"""
-    {lorem_ipsum()}
-
-    <h2>Explore Opportunities</h2>
-    {create_card_links([
-        ('Climate Classes', f'{BASE_URL}/programs-and-opportunities/climate-classes/', False),
-        ('Internships & Jobs', f'{BASE_URL}/programs-and-opportunities/internships-and-jobs/', False),
-        ('Clubs & Organizations', f'{BASE_URL}/programs-and-opportunities/clubs-and-organizations/', False),
-        ('Research & Mentoring Programs', f'{BASE_URL}/programs-and-opportunities/research-and-mentoring/', False),
-        ('Funding & Grants', f'{BASE_URL}/programs-and-opportunities/funding-and-grants/', False),
-        ('Partner Programs', f'{BASE_URL}/programs-and-opportunities/partner-programs/', False),
-    ])}
-    """
-})
+pages.append(Page(
+    path='programs-and-opportunities/index.html',
+    title='Programs & Opportunities',
+    breadcrumb=(('Home', HOME_URL), ('Programs & Opportunities', None)),
+    show_audience_filter=True,
+    content_parts=(
+        '\n    ',
+        lorem_ipsum(),
+        '\n\n    <h2>Explore Opportunities</h2>\n    ',
+        create_card_links([
+            ('Climate Classes', URLS['programs-and-opportunities'] + 'climate-classes/', False),
+            ('Internships & Jobs', URLS['programs-and-opportunities'] + 'internships-and-jobs/', False),
+            ('Clubs & Organizations', URLS['programs-and-opportunities'] + 'clubs-and-organizations/', False),
+            ('Research & Mentoring Programs', URLS['programs-and-opportunities'] + 'research-and-mentoring/', False),
+            ('Funding & Grants', URLS['programs-and-opportunities'] + 'funding-and-grants/', False),
+            ('Partner Programs', URLS['programs-and-opportunities'] + 'partner-programs/', False),
+        ]),
+        '\n    ',
+    )
+))
 
 # Programs sub-pages
 program_pages = [
@@ -299,63 +441,65 @@ program_pages = [
 ]
 
 for slug, title in program_pages:
-    pages.append({
-        'path': f'programs-and-opportunities/{slug}/index.html',
-        'title': title,
-        'breadcrumb': [('Home', f'{BASE_URL}/'), ('Programs & Opportunities', f'{BASE_URL}/programs-and-opportunities/'), (title, None)],
-        'show_audience_filter': True,
-        'content': lorem_ipsum()
-    })
+    pages.append(Page(
+        path=f'programs-and-opportunities/{slug}/index.html',
+        title=title,
+        breadcrumb=(('Home', HOME_URL), ('Programs & Opportunities', URLS['programs-and-opportunities']), (title, None)),
+        show_audience_filter=True,
+        content_parts=(lorem_ipsum(),)
+    ))
 
 # PEOPLE & PARTNERS SECTION
-pages.append({
-    'path': 'people-and-partners/index.html',
-    'title': 'People & Partners',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('People & Partners', None)],
-    'show_audience_filter': True,
-    'content': f"""
-    {lorem_ipsum()}
-
-    <h2>Connect With Our Community</h2>
-    {create_card_links([
-        ('Faculty & Staff', f'{BASE_URL}/faculty-and-staff/', False),
-        ('Student Leaders', f'{BASE_URL}/students/', False),
-        ('Off-Campus Partners', f'{BASE_URL}/off-campus-partners/', False),
-        ('Funders & Investors', f'{BASE_URL}/funders-and-investors/', False),
-        ('Media Contacts', f'{BASE_URL}/media/', False),
-        ('People Directory', f'{BASE_URL}/people-and-partners/people-directory/', True),
-    ])}
-    """
-})
-
-pages.append({
-    'path': 'people-and-partners/people-directory/index.html',
-    'title': 'People Directory',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('People & Partners', f'{BASE_URL}/people-and-partners/'), ('People Directory', None)],
-    'show_audience_filter': True,
-    'is_placeholder': True,
-    'content': lorem_ipsum()
-})
+pages.append(Page(
+    path='people-and-partners/index.html',
+    title='People & Partners',
+    breadcrumb=(('Home', HOME_URL), ('People & Partners', None)),
+    show_audience_filter=True,
+    content_parts=(
+        '\n    ',
+        lorem_ipsum(),
+        '\n\n    <h2>Connect With Our Community</h2>\n    ',
+        create_card_links([
+            ('Faculty & Staff', URLS['faculty-and-staff'], False),
+            ('Student Leaders', URLS['students'], False),
+            ('Off-Campus Partners', URLS['off-campus-partners'], False),
+            ('Funders & Investors', URLS['funders-and-investors'], False),
+            ('Media Contacts', URLS['media'], False),
+            ('People Directory', URLS['people-and-partners'] + 'people-directory/', True),
+        ]),
+        '\n    ',
+    )
+))
+
+pages.append(Page(
+    path='people-and-partners/people-directory/index.html',
+    title='People Directory',
+    breadcrumb=(('Home', HOME_URL), ('People & Partners', URLS['people-and-partners']), ('People Directory', None)),
+    show_audience_filter=True,
+    is_placeholder=True,
+    content_parts=(lorem_ipsum(),)
+))
 
 # RESOURCES & TOOLS SECTION
-pages.append({
-    'path': 'resources-and-tools/index.html',
-    'title': 'Resources & Tools',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('Resources & Tools', None)],
-    'show_audience_filter': True,
-    'content': f"""
-    {lorem_ipsum()}
-
-    <h2>Available Resources</h2>
-    {create_card_links([
-        ('BCCN Resource Hub', f'{BASE_URL}/bccn-resources/', False),
-        ('Student Financial Support', f'{BASE_URL}/resources-and-tools/financial-support/', False),
-        ('Give & Sponsor BCCN', f'{BASE_URL}/resources-and-tools/give-and-sponsor/', False),
-        ('Institutes and Centers Map', f'{BASE_URL}/resources-and-tools/institutes-and-centers-map/', False),
-        ('Climate Maps & Data', f'{BASE_URL}/resources-and-tools/climate-maps-data/', True),
-    ])}
-    """
-})
+pages.append(Page(
+    path='resources-and-tools/index.html',
+    title='Resources & Tools',
+    breadcrumb=(('Home', HOME_URL), ('Resources & Tools', None)),
+    show_audience_filter=True,
+    content_parts=(
+        '\n    ',
+        lorem_ipsum(),
+        '\n\n    <h2>Available Resources</h2>\n    ',
+        create_card_links([
+            ('BCCN Resource Hub', URLS['bccn-resources'], False),
+            ('Student Financial Support', URLS['resources-and-tools'] + 'financial-support/', False),
+            ('Give & Sponsor BCCN', URLS['resources-and-tools'] + 'give-and-sponsor/', False),
+            ('Institutes and Centers Map', URLS['resources-and-tools'] + 'institutes-and-centers-map/', False),
+            ('Climate Maps & Data', URLS['resources-and-tools'] + 'climate-maps-data/', True),
+        ]),
+        '\n    ',
+    )
+))
 
 resource_pages = [
     ('financial-support', 'Financial Support', False),
@@ -365,33 +509,34 @@ resource_pages = [
 ]
 
 for slug, title, is_placeholder in resource_pages:
-    pages.append({
-        'path': f'resources-and-tools/{slug}/index.html',
-        'title': title,
-        'breadcrumb': [('Home', f'{BASE_URL}/'), ('Resources & Tools', f'{BASE_URL}/resources-and-tools/'), (title, None)],
-        'show_audience_filter': True,
-        'is_placeholder': is_placeholder,
-        'content': lorem_ipsum()
-    })
+    pages.append(Page(
+        path=f'resources-and-tools/{slug}/index.html',
+        title=title,
+        breadcrumb=(('Home', HOME_URL), ('Resources & Tools', URLS['resources-and-tools']), (title, None)),
+        show_audience_filter=True,
+        is_placeholder=is_placeholder,
+        content_parts=(lorem_ipsum(),)
+    ))
 
 # NEWS, EVENTS & COMMUNITY SECTION
-pages.append({
-    'path': 'news-events-community/index.html',
-    'title': 'News, Events & Community',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('News, Events & Community', None)],
-    'show_audience_filter': True,
-    'content': f"""
-    {lorem_ipsum()}
-
-    <h2>Stay Connected</h2>
-    {create_card_links([
-        ('News & Updates', f'{BASE_URL}/news-events-community/news-and-updates/', False),
-        ('Events & Community', f'{BASE_URL}/news-events-community/events-and-community/', False),
-        ('Hot Topics', f'{BASE_URL}/news-events-community/hot-topics/', False),
-        ('Newsletter & Mailing Lists', f'{BASE_URL}/news-events-community/newsletter/', False),
-    ])}
-    """
-})
+pages.append(Page(
+    path='news-events-community/index.html',
+    title='News, Events & Community',
+    breadcrumb=(('Home', HOME_URL), ('News, Events & Community', None)),
+    show_audience_filter=True,
+    content_parts=(
+        '\n    ',
+        lorem_ipsum(),
+        '\n\n    <h2>Stay Connected</h2>\n    ',
+        create_card_links([
+            ('News & Updates', URLS['news-events-community'] + 'news-and-updates/', False),
+            ('Events & Community', URLS['news-events-community'] + 'events-and-community/', False),
+            ('Hot Topics', URLS['news-events-community'] + 'hot-topics/', False),
+            ('Newsletter & Mailing Lists', URLS['news-events-community'] + 'newsletter/', False),
+        ]),
+        '\n    ',
+    )
+))
 
 news_pages = [
     ('news-and-updates', 'News and Updates'),
@@ -402,33 +547,34 @@ news_pages = [
 ]
 
 for slug, title in news_pages:
-    pages.append({
-        'path': f'news-events-community/{slug}/index.html',
-        'title': title,
-        'breadcrumb': [('Home', f'{BASE_URL}/'), ('News, Events & Community', f'{BASE_URL}/news-events-community/'), (title, None)],
-        'show_audience_filter': True,
-        'content': lorem_ipsum()
-    })
+    pages.append(Page(
+        path=f'news-events-community/{slug}/index.html',
+        title=title,
+        breadcrumb=(('Home', HOME_URL), ('News, Events & Community', URLS['news-events-community']), (title, None)),
+        show_audience_filter=True,
+        content_parts=(lorem_ipsum(),)
+    ))
 
 # FACULTY & STAFF SECTION
-pages.append({
-    'path': 'faculty-and-staff/index.html',
-    'title': 'Faculty and Staff',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('Faculty and Staff', None)],
-    'show_audience_filter': True,
-    'content': f"""
-    {lorem_ipsum()}
-
-    <h2>Faculty & Staff Resources</h2>
-    {create_card_links([
-        ('People, Projects and Programs', f'{BASE_URL}/faculty-and-staff/people-projects-and-programs/', False),
-        ('Financial Support', f'{BASE_URL}/faculty-and-staff/financial-support/', False),
-        ('Find HELP!', f'{BASE_URL}/faculty-and-staff/find-help/', False),
-        ('Media Coverage', f'{BASE_URL}/faculty-and-staff/media-coverage/', False),
-        ('Hot Topics', f'{BASE_URL}/faculty-and-staff/hot-topics/', False),
-    ])}
-    """
-})
+pages.append(Page(
+    path='faculty-and-staff/index.html',
+    title='Faculty and Staff',
+    breadcrumb=(('Home', HOME_URL), ('Faculty and Staff', None)),
+    show_audience_filter=True,
+    content_parts=(
+        '\n    ',
+        lorem_ipsum(),
+        '\n\n    <h2>Faculty & Staff Resources</h2>\n    ',
+        create_card_links([
+            ('People, Projects and Programs', URLS['faculty-and-staff'] + 'people-projects-and-programs/', False),
+            ('Financial Support', URLS['faculty-and-staff'] + 'financial-support/', False),
+            ('Find HELP!', URLS['faculty-and-staff'] + 'find-help/', False),
+            ('Media Coverage', URLS['faculty-and-staff'] + 'media-coverage/', False),
+            ('Hot Topics', URLS['faculty-and-staff'] + 'hot-topics/', False),
+        ]),
+        '\n    ',
+    )
+))
 
 faculty_pages = [
     ('people-projects-and-programs', 'People, Projects and Programs'),
@@ -439,33 +585,34 @@ faculty_pages = [
 ]
 
 for slug, title in faculty_pages:
-    pages.append({
-        'path': f'faculty-and-staff/{slug}/index.html',
-        'title': title,
-        'breadcrumb': [('Home', f'{BASE_URL}/'), ('Faculty and Staff', f'{BASE_URL}/faculty-and-staff/'), (title, None)],
-        'show_audience_filter': True,
-        'content': lorem_ipsum()
-    })
+    pages.append(Page(
+        path=f'faculty-and-staff/{slug}/index.html',
+        title=title,
+        breadcrumb=(('Home', HOME_URL), ('Faculty and Staff', URLS['faculty-and-staff']), (title, None)),
+        show_audience_filter=True,
+        content_parts=(lorem_ipsum(),)
+    ))
 
 # STUDENTS SECTION
-pages.append({
-    'path': 'students/index.html',
-    'title': 'Students',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('Students', None)],
-    'show_audience_filter': True,
-    'content': f"""
-    {lorem_ipsum()}
-
-    <h2>Student Resources</h2>
-    {create_card_links([
-        ('Climate Classes', f'{BASE_URL}/students/climate-classes/', False),
-        ('Internships and Jobs', f'{BASE_URL}/students/internships-and-jobs/', False),
-        ('Clubs and Organizations', f'{BASE_URL}/students/clubs-and-organizations/', False),
-        ('Researchers, Mentors and Projects', f'{BASE_URL}/students/researchers-mentors-and-projects/', False),
-        ('Hot Topics', f'{BASE_URL}/students/hot-topics/', False),
-    ])}
-    """
-})
+pages.append(Page(
+    path='students/index.html',
+    title='Students',
+    breadcrumb=(('Home', HOME_URL), ('Students', None)),
+    show_audience_filter=True,
+    content_parts=(
+        '\n    ',
+        lorem_ipsum(),
+        '\n\n    <h2>Student Resources</h2>\n    ',
+        create_card_links([
+            ('Climate Classes', URLS['students'] + 'climate-classes/', False),
+            ('Internships and Jobs', URLS['students'] + 'internships-and-jobs/', False),
+            ('Clubs and Organizations', URLS['students'] + 'clubs-and-organizations/', False),
+            ('Researchers, Mentors and Projects', URLS['students'] + 'researchers-mentors-and-projects/', False),
+            ('Hot Topics', URLS['students'] + 'hot-topics/', False),
+        ]),
+        '\n    ',
+    )
+))
 
 student_pages = [
     ('climate-classes', 'Climate Classes'),
@@ -476,34 +623,35 @@ student_pages = [
 ]
 
 for slug, title in student_pages:
-    pages.append({
-        'path': f'students/{slug}/index.html',
-        'title': title,
-        'breadcrumb': [('Home', f'{BASE_URL}/'), ('Students', f'{BASE_URL}/students/'), (title, None)],
-        'show_audience_filter': True,
-        'content': lorem_ipsum()
-    })
+    pages.append(Page(
+        path=f'students/{slug}/index.html',
+        title=title,
+        breadcrumb=(('Home', HOME_URL), ('Students', URLS['students']), (title, None)),
+        show_audience_filter=True,
+        content_parts=(lorem_ipsum(),)
+    ))
 
 # BCCN RESOURCES (Cool BCCN Resources)
-pages.append({
-    'path': 'bccn-resources/index.html',
-    'title': 'BCCN Resource Hub',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('BCCN Resource Hub', None)],
-    'show_audience_filter': True,
-    'content': f"""
-    {lorem_ipsum()}
-
-    <h2>Cool BCCN Resources</h2>
-    {create_card_links([
-        ('Podcasts and Videos', f'{BASE_URL}/bccn-resources/podcasts-and-videos/', False),
-        ('In-Person Events and Webinars', f'{BASE_URL}/bccn-resources/events-and-webinars/', False),
-        ('Hot Topics', f'{BASE_URL}/bccn-resources/hot-topics/', False),
-        ('Campus Climate News', f'{BASE_URL}/bccn-resources/bccn-campus-climate-news/', False),
-        ('Berkeley Climate Calendar', f'{BASE_URL}/bccn-resources/berkeley-climate-calendar/', False),
-        ('Climate 101', f'{BASE_URL}/bccn-resources/climate-101/', False),
-    ])}
-    """
-})
+pages.append(Page(
+    path='bccn-resources/index.html',
+    title='BCCN Resource Hub',
+    breadcrumb=(('Home', HOME_URL), ('BCCN Resource Hub', None)),
+    show_audience_filter=True,
+    content_parts=(
+        '\n    ',
+        lorem_ipsum(),
+        '\n\n    <h2>Cool BCCN Resources</h2>\n    ',
+        create_card_links([
+            ('Podcasts and Videos', URLS['bccn-resources'] + 'podcasts-and-videos/', False),
+            ('In-Person Events and Webinars', URLS['bccn-resources'] + 'events-and-webinars/', False),
+            ('Hot Topics', URLS['bccn-resources'] + 'hot-topics/', False),
+            ('Campus Climate News', URLS['bccn-resources'] + 'bccn-campus-climate-news/', False),
+            ('Berkeley Climate Calendar', URLS['bccn-resources'] + 'berkeley-climate-calendar/', False),
+            ('Climate 101', URLS['bccn-resources'] + 'climate-101/', False),
+        ]),
+        '\n    ',
+    )
+))
 
 bccn_resource_pages = [
     ('podcasts-and-videos', 'Podcasts and Videos'),
@@ -515,64 +663,65 @@ bccn_resource_pages = [
 ]
 
 for slug, title in bccn_resource_pages:
-    pages.append({
-        'path': f'bccn-resources/{slug}/index.html',
-        'title': title,
-        'breadcrumb': [('Home', f'{BASE_URL}/'), ('BCCN Resource Hub', f'{BASE_URL}/bccn-resources/'), (title, None)],
-        'show_audience_filter': True,
-        'content': lorem_ipsum()
-    })
+    pages.append(Page(
+        path=f'bccn-resources/{slug}/index.html',
+        title=title,
+        breadcrumb=(('Home', HOME_URL), ('BCCN Resource Hub', URLS['bccn-resources']), (title, None)),
+        show_audience_filter=True,
+        content_parts=(lorem_ipsum(),)
+    ))
 
 # OFF-CAMPUS PARTNERS
-pages.append({
-    'path': 'off-campus-partners/index.html',
-    'title': 'Off-campus Partners',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('People & Partners', f'{BASE_URL}/people-and-partners/'), ('Off-campus Partners', None)],
-    'show_audience_filter': True,
-    'content': lorem_ipsum()
-})
+pages.append(Page(
+    path='off-campus-partners/index.html',
+    title='Off-campus Partners',
+    breadcrumb=(('Home', HOME_URL), ('People & Partners', URLS['people-and-partners']), ('Off-campus Partners', None)),
+    show_audience_filter=True,
+    content_parts=(lorem_ipsum(),)
+))
 
 # FUNDERS & INVESTORS
-pages.append({
-    'path': 'funders-and-investors/index.html',
-    'title': 'Funders and Investors',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('People & Partners', f'{BASE_URL}/people-and-partners/'), ('Funders and Investors', None)],
-    'show_audience_filter': True,
-    'content': lorem_ipsum()
-})
+pages.append(Page(
+    path='funders-and-investors/index.html',
+    title='Funders and Investors',
+    breadcrumb=(('Home', HOME_URL), ('People & Partners', URLS['people-and-partners']), ('Funders and Investors', None)),
+    show_audience_filter=True,
+    content_parts=(lorem_ipsum(),)
+))
 
 # MEDIA
-pages.append({
-    'path': 'media/index.html',
-    'title': 'Media',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('People & Partners', f'{BASE_URL}/people-and-partners/'), ('Media', None)],
-    'show_audience_filter': True,
-    'content': f"""
-    {lorem_ipsum()}
-
-    <h2>Media Resources</h2>
-    {create_card_links([
-        ('Media Inquiries', f'{BASE_URL}/media/media-inquiries/', False),
-        ('Press Kit', f'{BASE_URL}/media/press-kit/', False),
-    ])}
-    """
-})
-
-pages.append({
-    'path': 'media/media-inquiries/index.html',
-    'title': 'Media Inquiries',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('Media', f'{BASE_URL}/media/'), ('Media Inquiries', None)],
-    'show_audience_filter': False,
-    'content': lorem_ipsum()
-})
-
-pages.append({
-    'path': 'media/press-kit/index.html',
-    'title': 'Press Kit',
-    'breadcrumb': [('Home', f'{BASE_URL}/'), ('Media', f'{BASE_URL}/media/'), ('Press Kit', None)],
-    'show_audience_filter': False,
-    'content': lorem_ipsum()
-})
+pages.append(Page(
+    path='media/index.html',
+    title='Media',
+    breadcrumb=(('Home', HOME_URL), ('People & Partners', URLS['people-and-partners']), ('Media', None)),
+    show_audience_filter=True,
+    content_parts=(
+        '\n    ',
+        lorem_ipsum(),
+        '\n\n    <h2>Media Resources</h2>\n    ',
+        create_card_links([
+            ('Media Inquiries', URLS['media'] + 'media-inquiries/', False),
+            ('Press Kit', URLS['media'] + 'press-kit/', False),
+        ]),
+        '\n    ',
+    )
+))
+
+pages.append(Page(
+    path='media/media-inquiries/index.html',
+    title='Media Inquiries',
+    breadcrumb=(('Home', HOME_URL), ('Media', URLS['media']), ('Media Inquiries', None)),
+    show_audience_filter=False,
+    content_parts=(lorem_ipsum(),)
+))
+
+pages.append(Page(
+    path='media/press-kit/index.html',
+    title='Press Kit',
+    breadcrumb=(('Home', HOME_URL), ('Media', URLS['media']), ('Press Kit', None)),
+    show_audience_filter=False,
+    content_parts=(lorem_ipsum(),)
+))
 
 def create_filter_landing_page(category_slug):
     """Create a filter landing page for a specific category"""
@@ -581,134 +730,85 @@ def create_filter_landing_page(category_slug):
 
     # Find all pages tagged with this category
     tagged_pages = []
-    for page_url, tags in PAGE_TAGS.items():
-        if category_slug in tags:
-            # Determine page title from URL
-            if page_url == '/':
-                page_title = 'Home'
-            else:
-                # Try to extract title from the URL path
-                path_parts = page_url.strip('/').split('/')
-                page_title = path_parts[-1].replace('-', ' ').title()
-
-                # Special case handling for known pages
-                if page_url == '/about/':
-                    page_title = 'About BCCN'
-                elif page_url == '/students/':
-                    page_title = 'Students'
-                elif page_url == '/students/climate-classes/':
-                    page_title = 'Climate Classes'
-                elif page_url == '/students/internships-and-jobs/':
-                    page_title = 'Internships and Jobs'
-                elif page_url == '/students/clubs-and-organizations/':
-                    page_title = 'Clubs and Organizations'
-                elif page_url == '/students/hot-topics/':
-                    page_title = 'Hot Topics Global – Students'
-                elif page_url == '/faculty-and-staff/':
-                    page_title = 'Faculty and Staff'
-                elif page_url == '/faculty-and-staff/people-projects-and-programs/':
-                    page_title = 'People, Projects and Programs'
-                elif page_url == '/faculty-and-staff/financial-support/':
-                    page_title = 'Financial Support'
-                elif page_url == '/faculty-and-staff/hot-topics/':
-                    page_title = 'Global Hot Topics – Faculty & Staff'
-                elif page_url == '/faculty-and-staff/find-help/':
-                    page_title = 'Find HELP!'
-                elif page_url == '/bccn-resources/':
-                    page_title = 'Cool BCCN Resources'
-                elif page_url == '/bccn-resources/bccn-campus-climate-news/':
-                    page_title = 'BCCN Campus Climate News'
-                elif page_url == '/bccn-resources/podcasts-and-videos/':
-                    page_title = 'Podcasts and Videos'
-                elif page_url == '/bccn-resources/hot-topics/':
-                    page_title = 'BCCN Global Hot Topics – central'
-                elif page_url == '/off-campus-partners/':
-                    page_title = 'Off Campus Partners'
-                elif page_url == '/media/media-inquiries/':
-                    page_title = 'Media Inquiries'
-                elif page_url == '/funders-and-investors/':
-                    page_title = 'Funders/Investors'
-                elif page_url == '/resources-and-tools/give-and-sponsor/':
-                    page_title = 'Sponsors'
-
-            tagged_pages.append({
-                'title': page_title,
-                'url': f"{BASE_URL}{page_url}" if page_url != '/' else f"{BASE_URL}/"
-            })
+    for page_url in _PAGES_BY_CATEGORY[category_slug]:
+        # Known pages get a display title; everything else is derived from the URL
+        path_parts = page_url.strip('/').split('/')
+        page_title = _URL_TITLE_OVERRIDES.get(page_url) or path_parts[-1].replace('-', ' ').title()
+
+        tagged_pages.append({
+            'title': page_title,
+            'url': BASE_URL + page_url
+        })
 
     # Sort pages alphabetically by title
     tagged_pages.sort(key=lambda x: x['title'])
 
-    # Build the page content
-    content = f"""
-    <div style="background: #f9f9f9; padding: 20px; border-left: 4px solid #FDB515; margin-bottom: 30px;">
-      <p style="font-style: italic; color: #666; margin: 0;">
-        <strong>Note:</strong> This filter landing page is a draft. UX enhancements to follow.
-      </p>
-    </div>
-
-    <p>Below are all pages relevant to <strong>{title}</strong>:</p>
-
-    <div class="card-grid">
-    """
-
-    for page in tagged_pages:
-        content += f"""
-        <div class="card">
-          <h3><a href="{page['url']}">{page['title']}</a></h3>
-          <p>View this page</p>
-        </div>
-        """
-
-    content += """
-    </div>
-    """
-
-    return {
-        'path': f'filter/{category_slug}/index.html',
-        'title': title,
-        'breadcrumb': [('Home', f'{BASE_URL}/'), (f'{title} Filter', None)],
-        'show_audience_filter': True,
-        'content': content
-    }
+    cards_html = ''.join(_FILTER_CARD_TEMPLATE.format_map(page) for page in tagged_pages)
+
+    return Page(
+        path=f'filter/{category_slug}/index.html',
+        title=title,
+        breadcrumb=(('Home', HOME_URL), (f'{title} Filter', None)),
+        show_audience_filter=True,
+        content_parts=(_FILTER_PREAMBLE_TEMPLATE.format(title=title), cards_html, _FILTER_POSTAMBLE),
+    )
+
+def render_page(page):
+    """Render a single page, returning its site-relative path and HTML"""
+    breadcrumb = create_breadcrumb(page.breadcrumb)
+
+    html = create_page_template(
+        title=page.title,
+        breadcrumb=breadcrumb,
+        content_parts=page.content_parts,
+        show_audience_filter=page.show_audience_filter,
+        is_placeholder=page.is_placeholder
+    )
+
+    return page.path, minify_html(html)
+
+def write_archive(archive_path, outputs):
+    """Write all pages into one uncompressed zip archive, keyed by their site-relative path"""
+    # Imported here so the default loose-file run doesn't pay for it
+    import zipfile
+
+    # Like loose mode, create the output directory if it doesn't exist yet
+    Path(archive_path).parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_STORED) as zf:
+        for path, content in outputs:
+            zf.writestr(path, content)
 
 # Generate all pages
-def main():
+def main(argv=None):
     """Generate all pages"""
-    base_path = '/home/user/BCCN_website'
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--zip', metavar='PATH',
+                        help='write all pages into a single zip archive instead of loose files')
+    args = parser.parse_args(argv)
 
-    for page in pages:
-        breadcrumb = create_breadcrumb(page['breadcrumb'])
-        is_placeholder = page.get('is_placeholder', False)
-
-        html = create_page_template(
-            title=page['title'],
-            breadcrumb=breadcrumb,
-            content=page['content'],
-            show_audience_filter=page.get('show_audience_filter', False),
-            is_placeholder=is_placeholder
-        )
+    base_path = '/home/user/BCCN_website'
+    filter_pages = [create_filter_landing_page(slug) for slug in _FILTER_SLUGS]
 
-        file_path = os.path.join(base_path, page['path'])
-        write_page(file_path, html)
+    # Rendering all pages takes a few milliseconds, far less than starting
+    # worker processes would, so a plain loop is the fastest option here
+    outputs = [render_page(page) for page in pages]
 
     # Generate filter landing pages
-    filter_pages_count = 0
-    for category_slug in FILTER_CATEGORIES.keys():
-        filter_page = create_filter_landing_page(category_slug)
-        breadcrumb = create_breadcrumb(filter_page['breadcrumb'])
-
-        html = create_page_template(
-            title=filter_page['title'],
-            breadcrumb=breadcrumb,
-            content=filter_page['content'],
-            show_audience_filter=filter_page['show_audience_filter'],
-            is_placeholder=False
-        )
-
-        file_path = os.path.join(base_path, filter_page['path'])
-        write_page(file_path, html)
-        filter_pages_count += 1
+    outputs += [render_page(page) for page in filter_pages]
+    filter_pages_count = len(filter_pages)
+
+    # Paths written this run; reported in one stdout write at the end
+    created = []
+    if args.zip:
+        # One sequential write for deploy targets that unpack an archive
+        write_archive(args.zip, outputs)
+        created.append(args.zip)
+    else:
+        for path, content in outputs:
+            file_path = os.path.join(base_path, path)
+            write_page(file_path, content)
+            created.append(file_path)
+    sys.stdout.write(''.join(f"Created: {path}\n" for path in created))
 
     print(f"\n✓ Successfully generated {len(pages)} pages!")
     print(f"✓ Successfully generated {filter_pages_count} filter landing pages!")